@@ -27,7 +27,7 @@ Usage:
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 import numpy as np
 
@@ -122,6 +122,10 @@ class BacktestEngine:
         all_days = sorted(price_map)
         # Scan grid = trading days within [start_date, end_date]
         grid = [d for d in all_days if start_date <= d <= end_date]
+        # Positions by day, so each entry/exit lookup is O(1) instead of a
+        # list scan — the walk stays linear in the length of the history.
+        day_pos = {d: j for j, d in enumerate(all_days)}
+        grid_pos = {d: j for j, d in enumerate(grid)}
 
         trades: list[Trade] = []
         armed = True  # edge-trigger: only open when re-armed (signal returned to flat)
@@ -132,7 +136,7 @@ class BacktestEngine:
 
             if armed and abs(signal.value) > threshold:
                 direction = "long" if signal.value > 0 else "short"
-                entry_idx = all_days.index(d)
+                entry_idx = day_pos[d]
                 exit_idx = entry_idx + holding_days
                 if exit_idx >= len(all_days):
                     break  # not enough future data to close the position
@@ -144,7 +148,7 @@ class BacktestEngine:
                     trades.append(trade)
                 armed = False
                 # Skip ahead past the holding period — no overlapping positions
-                i = grid.index(all_days[exit_idx]) if all_days[exit_idx] in grid else len(grid)
+                i = grid_pos.get(all_days[exit_idx], len(grid))
                 continue
 
             # Re-arm once the model goes back to "no view"
@@ -262,20 +266,17 @@ class BacktestEngine:
         trades_per_year = n / years if years > 0 else n
         sharpe = (avg / std) * np.sqrt(trades_per_year) if std > 0 else 0.0
 
-        # Max drawdown: walk the equity curve tracking the peak. Whenever
-        # the value drops below the peak, measure how far it fell. The
-        # largest such drop is the max drawdown.
-        peak = equity_curve[0]
-        max_dd = 0.0
-        for val in equity_curve:
-            if val > peak:
-                peak = val
-            dd = (peak - val) / peak
-            if dd > max_dd:
-                max_dd = dd
+        # Max drawdown: track the running peak of the equity curve and
+        # measure how far each point sits below it. The largest such drop
+        # is the max drawdown. (np.maximum.accumulate is the running peak —
+        # one vectorized pass instead of a Python loop over the curve.)
+        curve = np.asarray(equity_curve)
+        peaks = np.maximum.accumulate(curve)
+        max_dd = float(((peaks - curve) / peaks).max())
 
         # Win rate: fraction of trades that made money
-        wins = sum(1 for r in returns if r > 0)
+        wins = int((arr > 0).sum())
+        n_long = sum(t.direction == "long" for t in trades)
 
         return PerformanceMetrics(
             total_return_pct=round(total_return_pct, 6),
@@ -284,8 +285,8 @@ class BacktestEngine:
             max_drawdown_pct=round(max_dd, 6),
             win_rate=round(wins / n, 4) if n > 0 else 0.0,
             n_trades=n,
-            n_long=sum(1 for t in trades if t.direction == "long"),
-            n_short=sum(1 for t in trades if t.direction == "short"),
+            n_long=n_long,
+            n_short=n - n_long,
             avg_return_pct=round(avg, 6),
             avg_holding_days=round(sum(t.holding_days for t in trades) / n, 1),
         )
@@ -296,4 +297,4 @@ class BacktestEngine:
 # ---------------------------------------------------------------------------
 
 def _parse_date(s: str) -> date:
-    return datetime.strptime(s[:10], "%Y-%m-%d").date()
+    return date.fromisoformat(s[:10])
@@ -174,21 +174,15 @@ def _metrics(
     # the first tick's move counts too.
     curve = np.array([capital] + nav)
     returns = curve[1:] / curve[:-1] - 1
-    if len(returns) > 1 and float(returns.std(ddof=1)) > 0:
-        sharpe = float(returns.mean() / returns.std(ddof=1)) * np.sqrt(
-            _PERIODS_PER_YEAR[cadence]
-        )
+    vol = float(returns.std(ddof=1)) if len(returns) > 1 else 0.0
+    if vol > 0:
+        sharpe = float(returns.mean()) / vol * np.sqrt(_PERIODS_PER_YEAR[cadence])
     else:
         sharpe = 0.0
 
-    peak = curve[0]
-    max_dd = 0.0
-    for value in curve:
-        if value > peak:
-            peak = value
-        drawdown = (peak - value) / peak
-        if drawdown > max_dd:
-            max_dd = drawdown
+    # Running peak in one numpy pass; the worst fall below it is the drawdown.
+    peaks = np.maximum.accumulate(curve)
+    max_dd = float(((peaks - curve) / peaks).max())
 
     benchmark_return = benchmark_nav[-1] / capital - 1
 
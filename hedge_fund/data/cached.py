@@ -4,9 +4,14 @@ Wraps any DataClient with a JSON file cache under ~/.hedge-fund/cache/data/. A w
 cache makes backtest reruns instant, free, and network-independent — the
 same (endpoint, params) request never hits the API twice.
 
-    fd = CachedDataClient(FDClient())
-    prices = fd.get_prices("AAPL", "2024-01-01", "2024-12-31")  # API call
-    prices = fd.get_prices("AAPL", "2024-01-01", "2024-12-31")  # disk, ~0ms
+    with FDClient() as raw:
+        fd = CachedDataClient(raw)
+        prices = fd.get_prices("AAPL", "2024-01-01", "2024-12-31")  # API call
+        prices = fd.get_prices("AAPL", "2024-01-01", "2024-12-31")  # memory, ~0ms
+
+The wrapper owns no resources of its own: the wrapped client's lifetime is
+the caller's, closed explicitly by the with-block rather than left to
+garbage collection.
 
 Failure semantics are inherited: only successful responses are cached, and
 errors from the wrapped client propagate (fail-loud preserved). Pass
@@ -17,8 +22,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
 
 from hedge_fund.data.models import (
     CompanyFacts,
@@ -47,6 +59,11 @@ class CachedDataClient:
         self._client = client
         self._dir = Path(cache_dir)
         self._refresh = refresh
+        self._dir_ready = False  # mkdir once, on the first write
+        # Decoded entries this instance has already read or fetched. One
+        # cycle asks for the same data many times over — every LLM analyst
+        # builds the same snapshot — and each ask was a disk read and decode.
+        self._memo: OrderedDict[str, Any] = OrderedDict()
 
     # ------------------------------------------------------------------
     # DataClient protocol
@@ -115,44 +132,108 @@ class CachedDataClient:
         canonical = json.dumps(params, sort_keys=True)
         return hashlib.sha256(f"{method}|{canonical}".encode()).hexdigest()[:24]
 
-    def _read(self, key: str) -> dict | None:
+    def _read(self, key: str, shape) -> Any:
+        """The entry's data decoded as *shape*, or _MISS.
+
+        The file goes to pydantic-core as raw bytes and comes back as models:
+        no intermediate dicts from json.loads for a validator to walk again.
+        """
         if self._refresh:
-            return None
+            return _MISS
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        # Just open it: a miss is the FileNotFoundError, so a hit costs one
+        # syscall rather than a stat followed by the read.
+        try:
+            raw = (self._dir / f"{key}.json").read_bytes()
+        except OSError:
+            return _MISS  # absent (the common miss) or unreadable
+        try:
+            data = _entry_adapter(shape).validate_json(raw)["data"]
+        except (ValidationError, KeyError):
+            return _MISS  # corrupt or stale-schema entry -> miss; rewritten on fetch
+        self._remember(key, data)
+        return data
+
+    def _write(self, key: str, data) -> None:
+        # Write-then-rename. The TUI warms this cache from a thread pool (one
+        # worker per ticker / agent, each with its own client), so two workers
+        # routinely fetch the same entry at once. A bare write_text lets a
+        # concurrent reader see a half-written file — it reads as corrupt, so
+        # the reader re-fetches and the warm pays the API twice. os.replace is
+        # atomic: readers see the old entry or the new one, never a torn one.
+        if not self._dir_ready:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
         path = self._dir / f"{key}.json"
-        if not path.exists():
-            return None
+        tmp = path.with_name(f"{key}.{os.getpid()}-{threading.get_ident()}.tmp")
         try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
-            return None  # corrupt entry -> miss; rewritten on fetch
-
-    def _write(self, key: str, payload: dict) -> None:
-        self._dir.mkdir(parents=True, exist_ok=True)
-        (self._dir / f"{key}.json").write_text(json.dumps(payload))
+            # pydantic-core serializes the models straight to JSON bytes —
+            # no model_dump() dicts to build and walk again with json.dumps.
+            # None fields are dropped: every optional field defaults to None,
+            # so they rehydrate unchanged, and a metrics row is mostly nulls.
+            tmp.write_bytes(to_json({"data": data}, exclude_none=True))
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._remember(key, data)
+
+    def _remember(self, key: str, data) -> None:
+        # Lists are held as tuples and handed out as fresh lists, so a caller
+        # sorting or filtering its own list can't reorder the next caller's.
+        # The model instances inside are shared — callers must not mutate them.
+        self._memo[key] = tuple(data) if isinstance(data, list) else data
+        self._memo.move_to_end(key)
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
 
     def _cached_list(self, method: str, model_cls, params: dict, fetch: Callable) -> list:
         key = self._key(method, params)
-        hit = self._read(key)
-        if hit is not None:
-            return [model_cls(**row) for row in hit["data"]]
+        hit = self._read(key, list[model_cls])
+        if hit is not _MISS:
+            return list(hit)
         result = fetch()
-        self._write(key, {"data": [r.model_dump() for r in result]})
+        self._write(key, result)
         return result
 
     def _cached_item(self, method: str, model_cls, params: dict, fetch: Callable):
         key = self._key(method, params)
-        hit = self._read(key)
-        if hit is not None:
-            return model_cls(**hit["data"]) if hit["data"] is not None else None
+        hit = self._read(key, model_cls | None)
+        if hit is not _MISS:
+            return hit
         result = fetch()
-        self._write(key, {"data": result.model_dump() if result is not None else None})
+        self._write(key, result)
         return result
 
     def _cached_scalar(self, method: str, params: dict, fetch: Callable):
         key = self._key(method, params)
-        hit = self._read(key)
-        if hit is not None:
-            return hit["data"]
+        hit = self._read(key, Any)
+        if hit is not _MISS:
+            return hit
         result = fetch()
-        self._write(key, {"data": result})
+        self._write(key, result)
         return result
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+# Sentinel for a cache miss — None is a legitimate cached value.
+_MISS = object()
+
+# Decoded entries kept in memory per client. Enough for a cycle's working set
+# (a few endpoints x the universe); old entries fall back to disk.
+_MEMO_SIZE = 256
+
+
+@cache
+def _entry_adapter(shape) -> TypeAdapter:
+    """One validator per entry shape ({"data": list[Price]}, ...).
+
+    A price history is hundreds of rows; decoding and validating it in a
+    single pydantic-core call keeps the per-row loop out of Python, which is
+    most of the cost of a warm-cache hit.
+    """
+    return TypeAdapter(dict[str, shape])
@@ -7,6 +7,9 @@ import os
 import time
 
 import requests
+from pydantic_core import from_json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hedge_fund.data.models import (
     CompanyFacts,
@@ -44,6 +47,7 @@ class FDClient:
 
     BASE_URL = "https://api.financialdatasets.ai"
     _RETRY_DELAYS = (5, 15, 30)
+    _CONNECT_RETRIES = 2
 
     def __init__(
         self,
@@ -54,6 +58,17 @@ class FDClient:
         self._timeout = timeout
         self._session = requests.Session()
         self._session.headers["X-API-Key"] = self._api_key
+        # The session already keeps connections alive; the adapter adds a
+        # short retry for DNS/TCP connect failures only. Nothing has reached
+        # the server yet, so a retry cannot duplicate a request — and one
+        # flaky connect no longer sinks an hour-long cache warm. Anything
+        # later (a reset mid-handshake or mid-response counts as a read
+        # error) and HTTP statuses are left to _request's fail-loud contract.
+        adapter = HTTPAdapter(max_retries=Retry(
+            total=None, connect=self._CONNECT_RETRIES, read=0, status=0, other=0,
+            backoff_factor=0.5,
+        ))
+        self._session.mount("https://", adapter)
 
     # ------------------------------------------------------------------
     # Context manager
@@ -164,7 +179,7 @@ class FDClient:
         resp = self._request("GET", "/company/facts/", params={"ticker": ticker})
         if resp is None:
             return None
-        facts_data = resp.json().get("company_facts")
+        facts_data = from_json(resp.content).get("company_facts")
         return CompanyFacts(**facts_data) if facts_data else None
 
     # ------------------------------------------------------------------
@@ -234,18 +249,22 @@ class FDClient:
 
         A mid-walk 404 ends the stream and keeps the rows accumulated so
         far; any other failure raises via _request's fail-loud contract.
+
+        Bodies are decoded with pydantic-core's Rust parser rather than
+        ``resp.json()`` — price and news pages run to megabytes during a
+        cache warm, and the stdlib decoder was the bulk of their cost.
         """
         resp = self._request("GET", path, params=params)
         if resp is None:
             return None
-        body = resp.json()
+        body = from_json(resp.content)
         rows = body.get(response_key)
         next_page_url = body.get("next_page_url")
         while next_page_url and isinstance(rows, list):
             resp = self._request("GET", next_page_url)
             if resp is None:
                 break
-            body = resp.json()
+            body = from_json(resp.content)
             rows.extend(body.get(response_key) or [])
             next_page_url = body.get("next_page_url")
         return rows
@@ -56,6 +56,16 @@ def test_refresh_busts_cache(tmp_path):
     assert inner.calls == 2
 
 
+def test_refresh_refetches_every_call(tmp_path):
+    """refresh=True bypasses the in-memory memo too, not just the disk."""
+    inner = CountingClient()
+    fd = CachedDataClient(inner, cache_dir=tmp_path, refresh=True)
+    fd.get_prices("AAPL", "2024-01-01", "2024-12-31")
+    fd.get_prices("AAPL", "2024-01-01", "2024-12-31")
+
+    assert inner.calls == 2
+
+
 def test_none_item_is_cached(tmp_path):
     """A cached None (ticker without facts) must not re-hit the API."""
     inner = CountingClient(facts=None)
@@ -85,3 +95,61 @@ def test_scalar_cached(tmp_path):
     assert fd.get_market_cap("AAPL", "2024-12-31") == 3.0e12
     assert fd.get_market_cap("AAPL", "2024-12-31") == 3.0e12
     assert inner.calls == 1
+
+
+def test_concurrent_writers_leave_one_clean_entry(tmp_path):
+    """Warm workers racing on the same key must not leave torn or stray files."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(_):
+        fd = CachedDataClient(CountingClient(), cache_dir=tmp_path, refresh=True)
+        return fd.get_prices("AAPL", "2024-01-01", "2024-12-31")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(fetch, range(32)))
+
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+    inner = CountingClient()
+    assert CachedDataClient(inner, cache_dir=tmp_path).get_prices(
+        "AAPL", "2024-01-01", "2024-12-31")[0].close == 2.0
+    assert inner.calls == 0
+
+
+def test_corrupt_or_stale_entry_is_a_miss(tmp_path):
+    inner = CountingClient()
+
+    def fetch():  # a fresh client each time, so the read goes to disk
+        fd = CachedDataClient(inner, cache_dir=tmp_path)
+        return fd.get_prices("AAPL", "2024-01-01", "2024-12-31")
+
+    fetch()
+    (entry,) = tmp_path.iterdir()
+    entry.write_text('{"data": [{"close": "not a number"}]}')  # old/foreign schema
+    assert fetch()[0].close == 2.0
+    entry.write_text('{"data": [')  # torn write
+    assert fetch()[0].close == 2.0
+    assert inner.calls == 3
+
+
+def test_sparse_rows_round_trip(tmp_path):
+    """None fields are omitted on disk and must rehydrate to the same model."""
+    facts = CompanyFacts(ticker="AAPL", sector="Tech")
+    fd = CachedDataClient(CountingClient(facts=facts), cache_dir=tmp_path)
+    fd.get_company_facts("AAPL")
+
+    (entry,) = tmp_path.iterdir()
+    assert "null" not in entry.read_text()
+    assert fd.get_company_facts("AAPL") == facts
+
+
+def test_repeat_reads_are_served_from_memory(tmp_path):
+    """Within one client a hit is decoded once; callers get their own lists."""
+    fd = CachedDataClient(CountingClient(), cache_dir=tmp_path)
+    first = fd.get_prices("AAPL", "2024-01-01", "2024-12-31")
+    first.clear()  # a caller mutating its result must not leak into the next
+
+    for entry in tmp_path.iterdir():
+        entry.unlink()  # a disk read would now miss and re-fetch
+    again = fd.get_prices("AAPL", "2024-01-01", "2024-12-31")
+    assert len(again) == 1
+    assert fd._client.calls == 1
@@ -10,6 +10,8 @@ Pins the two Phase 0 guarantees:
    future into a backtest).
 """
 
+import json
+
 import pytest
 import requests
 
@@ -21,9 +23,7 @@ class _FakeResponse:
         self.status_code = status_code
         self._payload = payload or {}
         self.text = text
-
-    def json(self):
-        return self._payload
+        self.content = json.dumps(self._payload).encode()
 
 
 @pytest.fixture
@@ -102,6 +102,86 @@ def test_429_then_success_recovers(client, monkeypatch):
     assert len(prices) == 1
 
 
+@pytest.fixture
+def server():
+    """A local HTTP server: {"mode": ...} picks its reply, "hits" counts
+    requests that actually arrived. Modes: "ok" (200 JSON), "drop" (close
+    without replying — a read error), "throttle" (429 + Retry-After)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import threading
+
+    state = {"mode": "ok", "hits": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["hits"] += 1
+            if state["mode"] == "drop":
+                self.close_connection = True
+                return
+            status, headers = 200, {}
+            if state["mode"] == "throttle":
+                status, headers = 429, {"Retry-After": "0"}
+            body = b"{}"
+            self.send_response(status)
+            for name, value in {**headers, "Content-Length": str(len(body))}.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{httpd.server_address[1]}/"
+    yield state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def session(client):
+    """The client's session with its https transport also serving http://,
+    so the real adapter and Retry policy talk to the local server."""
+    client._session.mount("http://", client._session.get_adapter(FDClient.BASE_URL))
+    return client._session
+
+
+def test_failed_connect_is_retried(session, server, monkeypatch):
+    from urllib3.connection import HTTPConnection
+    from urllib3.exceptions import NewConnectionError
+
+    original = HTTPConnection._new_conn
+    failures = []
+
+    def flaky_new_conn(conn):
+        if not failures:
+            failures.append(conn)
+            raise NewConnectionError(conn, "connection refused")
+        return original(conn)
+
+    monkeypatch.setattr(HTTPConnection, "_new_conn", flaky_new_conn)
+
+    assert session.get(server["url"], timeout=5).status_code == 200
+    assert len(failures) == 1
+    assert server["hits"] == 1
+
+
+def test_read_error_is_not_retried(session, server):
+    """The request may have reached the server — a retry could duplicate it."""
+    server["mode"] = "drop"
+    with pytest.raises(requests.ConnectionError):
+        session.get(server["url"], timeout=5)
+    assert server["hits"] == 1
+
+
+def test_429_is_not_retried_by_the_transport(session, server):
+    """Throttling is _request's job (its own backoff loop), not the adapter's."""
+    server["mode"] = "throttle"
+    assert session.get(server["url"], timeout=5).status_code == 429
+    assert server["hits"] == 1
+
+
 # ---------------------------------------------------------------------------
 # Point-in-time contract
 # ---------------------------------------------------------------------------
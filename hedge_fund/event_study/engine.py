@@ -27,7 +27,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 import numpy as np
 
@@ -180,9 +180,11 @@ def _compute_ticker_events(
     if len(trading_days) < _MIN_ESTIMATION_DAYS + _MAX_EVENT_WINDOW:
         return []
 
-    # Convert aligned closes to numpy arrays in date order
-    stock_close_arr = np.array([stock_closes[d] for d in trading_days])
-    spy_close_arr = np.array([spy_closes[d] for d in trading_days])
+    # Convert aligned closes to numpy arrays in date order (fromiter fills
+    # the array directly — no intermediate Python list per series)
+    n_days = len(trading_days)
+    stock_close_arr = np.fromiter(map(stock_closes.__getitem__, trading_days), float, n_days)
+    spy_close_arr = np.fromiter(map(spy_closes.__getitem__, trading_days), float, n_days)
 
     # Simple daily returns: r_t = (P_t - P_{t-1}) / P_{t-1}
     # returns[i] is the return "on" trading_days[i+1]
@@ -284,7 +286,7 @@ def _process_event(
         report_period=record.report_period,
         eps_surprise=eps_surprise,
         market_model=model,
-        daily_ar=[float(x) for x in daily_ar],
+        daily_ar=daily_ar.tolist(),
         car_0_1=cars["car_0_1"],
         car_0_5=cars["car_0_5"],
         car_0_20=cars["car_0_20"],
@@ -363,7 +365,7 @@ def _aggregate(
 
 def _parse_date(s: str) -> date:
     """Parse 'YYYY-MM-DD' string to a date object."""
-    return datetime.strptime(s[:10], "%Y-%m-%d").date()
+    return date.fromisoformat(s[:10])
 
 
 def _filter_retrospective(records: list[EarningsRecord]) -> list[EarningsRecord]:
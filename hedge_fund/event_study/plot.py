@@ -13,12 +13,18 @@ fig.savefig() or plt.show().
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
 
 from hedge_fund.event_study.models import EventStudyResult
 
+# pyplot is imported inside each function: it takes most of a second to load,
+# and the package re-exports these plots, so importing it here would charge
+# every `hedge_fund.event_study` user, including runs that never draw.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 def plot_car_by_source(result: EventStudyResult) -> Figure:
     """Grouped bar chart: mean CAR by source_type and event window.
@@ -31,6 +37,8 @@ def plot_car_by_source(result: EventStudyResult) -> Figure:
     This is the primary chart — it answers "do earnings move prices,
     and does the signal differ by filing type?"
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     # Only plot source types that have computed window stats
@@ -92,6 +100,8 @@ def plot_car_distribution(
     A tight distribution around a non-zero mean = consistent signal.
     A wide distribution = high variance, even if mean is significant.
     """
+    import matplotlib.pyplot as plt
+
     # Map window labels to EventCAR attribute names
     car_attr = {"[0,+1]": "car_0_1", "[0,+5]": "car_0_5", "[0,+20]": "car_0_20"}
     attr = car_attr.get(window, "car_0_1")
@@ -145,6 +155,8 @@ def plot_cumulative_ar(
     One line per source_type (or a single line if source_type is specified).
     Shaded band = ±1 standard error around the mean.
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     # Group daily AR series by source_type
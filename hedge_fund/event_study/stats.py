@@ -8,7 +8,6 @@ calls these to do the actual math.
 from __future__ import annotations
 
 import numpy as np
-from scipy import stats as sp_stats
 
 from hedge_fund.event_study.models import BootstrapCI, MarketModelFit
 
@@ -80,6 +79,10 @@ def ttest_cars(cars: np.ndarray) -> tuple[float, float]:
     """
     if len(cars) < 2:
         return 0.0, 1.0
+    # scipy.stats takes about a second to import and this is its only use —
+    # pay for it on the first test, not on every import of the package.
+    from scipy import stats as sp_stats
+
     t_stat, p_value = sp_stats.ttest_1samp(cars, popmean=0.0)
     return float(t_stat), float(p_value)
 
@@ -141,8 +141,10 @@ def build_snapshot(
     # which is latest-only — lookahead in a backtest.
     facts = data_client.get_company_facts(ticker)
 
+    # Read the shared fields straight off each row: no intermediate dump dict
+    # (and no field set rebuilt per row) just to validate it again.
     rows = [
-        PeriodFundamentals(**m.model_dump(include=set(PeriodFundamentals.model_fields)))
+        PeriodFundamentals.model_validate(m, from_attributes=True)
         for m in metrics
     ]
 
@@ -25,6 +25,7 @@ across cycles.
 
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from typing import Any, Literal
 
@@ -133,8 +134,8 @@ class FundSpec(BaseModel):
     @field_validator("strategies")
     @classmethod
     def _unique_strategy_names(cls, strategies: list[StrategySpec]) -> list[StrategySpec]:
-        names = [s.name for s in strategies]
-        duplicates = {n for n in names if names.count(n) > 1}
+        counts = Counter(s.name for s in strategies)
+        duplicates = {n for n, c in counts.items() if c > 1}
         if duplicates:
             raise ValueError(f"duplicate strategy names: {sorted(duplicates)}")
         return strategies
@@ -147,11 +148,16 @@ def normalize_universe(tickers: list[str]) -> list[str]:
     API), so what the engine trades can't drift by caller. Empty raises: a
     cycle with nothing to trade is a caller mistake, not an empty result.
     """
-    universe: list[str] = []
-    for ticker in tickers:
-        upper = ticker.strip().upper()
-        if upper and upper not in universe:
-            universe.append(upper)
+    if isinstance(tickers, str):
+        # A bare "AAPL,MSFT" would iterate as characters and trade "A", "P"…
+        raise TypeError(
+            f"universe must be a list of tickers, not the string {tickers!r} — "
+            "split it first"
+        )
+    # dict.fromkeys de-dupes in insertion order with hashed lookups — a list
+    # membership test here is quadratic in the size of a pasted universe.
+    cleaned = (ticker.strip().upper() for ticker in tickers)
+    universe = list(dict.fromkeys(t for t in cleaned if t))
     if not universe:
         raise ValueError("universe is empty — a run needs at least one ticker")
     return universe
@@ -112,6 +112,8 @@ def test_normalize_universe():
         normalize_universe([])
     with pytest.raises(ValueError, match="universe is empty"):
         normalize_universe(["  "])
+    with pytest.raises(TypeError, match="split it first"):
+        normalize_universe("AAPL,MSFT")
 
 
 def test_duplicate_strategy_name_rejected():
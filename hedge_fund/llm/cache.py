@@ -13,10 +13,11 @@ Files live under ~/.hedge-fund/cache/llm/, keyed by a hash of
 from __future__ import annotations
 
 import hashlib
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from pydantic_core import from_json, to_json
+
 from hedge_fund.paths import CACHE_DIR
 
 DEFAULT_CACHE_DIR = CACHE_DIR / "llm"
@@ -31,18 +32,22 @@ def prompt_key(agent: str, model: str, system: str, user: str) -> str:
 class PromptCache:
     def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR) -> None:
         self._dir = Path(cache_dir)
+        self._dir_ready = False  # mkdir once, on the first put
 
     def get(self, key: str) -> dict | None:
-        path = self._dir / f"{key}.json"
-        if not path.exists():
-            return None
         try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
+            raw = (self._dir / f"{key}.json").read_bytes()
+        except OSError:
+            return None  # absent (the common miss) or unreadable
+        try:
+            return from_json(raw)
+        except ValueError:
             return None  # corrupt cache entry -> treat as miss, will be rewritten
 
     def put(self, key: str, record: dict) -> None:
-        self._dir.mkdir(parents=True, exist_ok=True)
-        record = {**record, "created_at": datetime.now(timezone.utc).isoformat()}
+        if not self._dir_ready:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        record = record | {"created_at": datetime.now(timezone.utc).isoformat()}
         path = self._dir / f"{key}.json"
-        path.write_text(json.dumps(record, indent=2))
+        path.write_bytes(to_json(record, indent=2))
@@ -15,6 +15,8 @@ import json
 import os
 import re
 from collections.abc import Callable
+from functools import lru_cache
+from importlib import import_module
 from typing import Protocol, runtime_checkable
 
 from hedge_fund.llm.registry import (
@@ -108,38 +110,8 @@ def make_llm(
         )
 
     api_key = _require_key(provider)
-
-    if provider == "Anthropic":
-        from langchain_anthropic import ChatAnthropic
-        chat = ChatAnthropic(model=model, api_key=api_key, timeout=timeout,
-                             max_retries=1, max_tokens=max_tokens)
-    elif provider == "OpenAI":
-        from langchain_openai import ChatOpenAI
-        chat = ChatOpenAI(model=model, api_key=api_key, timeout=timeout,
-                          max_retries=1, base_url=os.getenv("OPENAI_API_BASE"))
-    elif provider == "DeepSeek":
-        from langchain_deepseek import ChatDeepSeek
-        chat = ChatDeepSeek(model=model, api_key=api_key, timeout=timeout,
-                            max_retries=1)
-    elif provider == "Google":
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        chat = ChatGoogleGenerativeAI(model=model, api_key=api_key,
-                                      timeout=timeout, max_retries=1)
-    elif provider == "xAI":
-        from langchain_xai import ChatXAI
-        chat = ChatXAI(model=model, api_key=api_key, timeout=timeout,
-                       max_retries=1)
-    elif provider == "Kimi":
-        # Moonshot speaks the OpenAI wire format. Default to the international
-        # host; mainland users override with MOONSHOT_BASE_URL (v1 does the same).
-        from langchain_openai import ChatOpenAI
-        chat = ChatOpenAI(
-            model=model, api_key=api_key, timeout=timeout, max_retries=1,
-            base_url=(os.getenv("MOONSHOT_BASE_URL")
-                      or "https://api.moonshot.ai/v1"))
-    else:  # pragma: no cover - SUPPORTED_PROVIDERS is checked above
-        raise ValueError(f"Unhandled provider {provider}")
-
+    chat = _chat_model(provider, model, api_key, timeout, max_tokens,
+                       _base_url(provider))
     return ChatLLM(model, chat, on_token)
 
 
@@ -149,6 +121,60 @@ def AnthropicLLM(model: str | None = None, **kwargs) -> ChatLLM:  # noqa: N802
     return make_llm(model or DEFAULT_MODEL, **kwargs)
 
 
+# provider -> (module, chat class), imported on first use so only the SDK in
+# use is ever loaded. Anthropic alone is given max_tokens: its API requires
+# one, and the others default to the model's own limit. Kimi is Moonshot,
+# which speaks the OpenAI wire format.
+_CHAT_CLASSES: dict[str, tuple[str, str]] = {
+    "Anthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "OpenAI": ("langchain_openai", "ChatOpenAI"),
+    "DeepSeek": ("langchain_deepseek", "ChatDeepSeek"),
+    "Google": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "xAI": ("langchain_xai", "ChatXAI"),
+    "Kimi": ("langchain_openai", "ChatOpenAI"),
+}
+
+
+@lru_cache(maxsize=32)
+def _chat_model(
+    provider: str,
+    model: str,
+    api_key: str,
+    timeout: float,
+    max_tokens: int,
+    base_url: str | None,
+):
+    """The langchain chat model for one exact configuration, built once.
+
+    Every LLMAgent calls make_llm(), and the TUI warm builds an agent per
+    (agent, ticker) task — each used to get its own SDK client and HTTP pool,
+    paying a fresh TLS handshake on its first call. The SDK clients are safe
+    to share across threads, and the key and base URL are part of the cache
+    key, so a rotated key or endpoint still gets a fresh client. The
+    per-caller streaming listener lives on ChatLLM, not here.
+    """
+    module, name = _CHAT_CLASSES[provider]
+    chat_class = getattr(import_module(module), name)
+    kwargs: dict = {"model": model, "api_key": api_key, "timeout": timeout,
+                    "max_retries": 1}
+    if provider == "Anthropic":
+        kwargs["max_tokens"] = max_tokens
+    if base_url is not None:
+        kwargs["base_url"] = base_url
+    return chat_class(**kwargs)
+
+
+def _base_url(provider: str) -> str | None:
+    """A provider's endpoint override from the environment, if it has one."""
+    if provider == "OpenAI":
+        return os.getenv("OPENAI_API_BASE")
+    if provider == "Kimi":
+        # Default to the international host; mainland users override with
+        # MOONSHOT_BASE_URL (v1 does the same).
+        return os.getenv("MOONSHOT_BASE_URL") or "https://api.moonshot.ai/v1"
+    return None
+
+
 def _flatten(content, sep: str = "\n") -> str:
     """One provider's response as plain text.
 
@@ -12,6 +12,7 @@ TUI package would close an import cycle.)
 from __future__ import annotations
 
 import json
+from functools import cache
 from pathlib import Path
 
 API_MODELS_PATH = Path(__file__).resolve().parent / "api_models.json"
@@ -26,7 +27,7 @@ PROVIDER_ENV_VARS = {
     "Kimi": "KIMI_API_KEY",
 }
 
-# Providers v2 has a client for (see client.py:make_llm). Anything in the
+# Providers v2 has a client for (see client.py:_CHAT_CLASSES). Anything in the
 # registry but missing here is shown in the picker and not selectable — better
 # a greyed row than a run that dies on an id the transport rejects.
 SUPPORTED_PROVIDERS = frozenset(PROVIDER_ENV_VARS)
@@ -40,20 +41,37 @@ def load_api_models() -> list[tuple[str, str, str]]:
     Falls back to the built-in default alone if the file is missing or
     malformed — a broken registry should cost you the picker, not the app.
     """
+    return list(_entries())
+
+
+@cache
+def _entries() -> tuple[tuple[str, str, str], ...]:
+    # The file ships with the package and never changes under a running
+    # process, yet every make_llm() and picker redraw asks for it — parse it
+    # once. load_api_models hands out copies so callers can't mutate this.
     try:
         entries = json.loads(API_MODELS_PATH.read_text())
-        models = [(e["display_name"], e["model_name"], e["provider"])
-                  for e in entries]
+        models = tuple((e["display_name"], e["model_name"], e["provider"])
+                       for e in entries)
     except (OSError, ValueError, KeyError, TypeError):
-        return [_FALLBACK]
-    return models or [_FALLBACK]
+        return (_FALLBACK,)
+    return models or (_FALLBACK,)
+
+
+@cache
+def _providers() -> dict[str, str]:
+    # model id -> provider, built once from the parsed registry. First listing
+    # wins, as the linear scan it replaces did.
+    index: dict[str, str] = {}
+    for _, mid, prov in _entries():
+        index.setdefault(mid, prov)
+    return index
 
 
 def provider_for(model_id: str) -> str | None:
     """Which provider serves a model id. None if it is not in the registry —
     a hand-exported HEDGE_FUND_LLM_MODEL should not be second-guessed."""
-    return next((prov for _, mid, prov in load_api_models() if mid == model_id),
-                None)
+    return _providers().get(model_id)
 
 
 def env_var_for(provider: str) -> str | None:
@@ -8,10 +8,13 @@ call the API.
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
 from hedge_fund.llm import ChatLLM, SUPPORTED_PROVIDERS, load_api_models, make_llm, provider_for
-from hedge_fund.llm.client import _flatten
+from hedge_fund.llm.client import _CHAT_CLASSES, _flatten
 from hedge_fund.llm.registry import PROVIDER_ENV_VARS
 
 # One model id per provider, taken from the registry so this test fails loudly
@@ -46,6 +49,11 @@ def test_registry_and_clients_agree():
     assert listed <= SUPPORTED_PROVIDERS, f"no client for: {listed - SUPPORTED_PROVIDERS}"
 
 
+def test_every_supported_provider_has_a_chat_class():
+    """The dispatch table and the supported set are one list in two places."""
+    assert set(_CHAT_CLASSES) == SUPPORTED_PROVIDERS
+
+
 def test_missing_key_names_the_variable(monkeypatch):
     """The error tells you which variable to set — the only actionable fact."""
     monkeypatch.delenv("HEDGE_FUND_LLM_MODEL", raising=False)
@@ -71,6 +79,30 @@ def test_kimi_accepts_moonshot_key(monkeypatch):
     assert make_llm(_BY_PROVIDER["Kimi"]).model == _BY_PROVIDER["Kimi"]
 
 
+def test_same_configuration_shares_one_chat_model(keyed, monkeypatch):
+    """Agents built with the same settings share one SDK client (and its
+    connection pool); a different key must not be served the old one."""
+    model_id = _BY_PROVIDER["Anthropic"]
+    first, second = make_llm(model_id), make_llm(model_id, on_token=print)
+    assert first._chat is second._chat
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "another-test-key")
+    assert make_llm(model_id)._chat is not first._chat
+
+
+def test_importing_the_app_loads_no_provider_sdk():
+    """Provider SDKs are imported inside make_llm, for the one provider in
+    use — each drags in seconds of transitive imports, and CLI startup and
+    the TUI's first paint should not pay for five of them."""
+    probe = (
+        "import sys, hedge_fund.llm, hedge_fund.signals, hedge_fund.tui.app; "
+        "print(sorted({m.split('.')[0] for m in sys.modules "
+        "if m.startswith(('langchain', 'anthropic', 'openai', 'google'))}))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], check=True,
+                         capture_output=True, text=True).stdout
+    assert out.strip() == "[]"
+
+
 def test_provider_for_reads_the_registry():
     assert provider_for("claude-opus-5") == "Anthropic"
     assert provider_for("gpt-5.5") == "OpenAI"
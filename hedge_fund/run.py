@@ -121,9 +121,10 @@ def main() -> None:
                 spinner="dots",
             ):
                 result = backtest_fund(fund, start, args.date, fd, universe)
-        print(result.model_dump_json(indent=2))
+        receipt = result.model_dump_json(indent=2)
+        print(receipt)
         if args.out:
-            Path(args.out).write_text(result.model_dump_json(indent=2))
+            Path(args.out).write_text(receipt)
         m = result.metrics
         console.print(
             f"[bold]{spec.name}[/] {result.start} → {result.end}  ·  "
@@ -146,9 +147,10 @@ def main() -> None:
         ):
             record = run_cycle(fund, args.date, broker, fd, universe)
 
-    print(record.model_dump_json(indent=2))
+    receipt = record.model_dump_json(indent=2)
+    print(receipt)
     if args.out:
-        Path(args.out).write_text(record.model_dump_json(indent=2))
+        Path(args.out).write_text(receipt)
 
     for sr in record.strategies:
         abstained = sum(1 for s in sr.signals if s.metadata.get("abstained") is True)
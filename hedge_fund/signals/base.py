@@ -18,13 +18,18 @@ and execution. This separation (views vs positions) is deliberate.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
 from hedge_fund.data.protocol import DataClient
 from hedge_fund.models import Signal
 
+if TYPE_CHECKING:
+    # pandas costs ~0.3s to import and only _compute_rsi touches it; every
+    # entry point imports this module, so it is loaded on first use instead.
+    import pandas as pd
+
 
 class AlphaModel(ABC):
     """Abstract base for all alpha models. Forms a view, returns a Signal."""
@@ -94,6 +99,8 @@ class QuantModel(AlphaModel):
     @staticmethod
     def _compute_rsi(prices: pd.Series, period: int = 14) -> float:
         """Compute the latest RSI value for a price series."""
+        import pandas as pd
+
         delta = prices.diff()
         gain = delta.where(delta > 0, 0.0).rolling(window=period).mean()
         loss = (-delta.where(delta < 0, 0.0)).rolling(window=period).mean()
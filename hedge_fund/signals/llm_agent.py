@@ -87,11 +87,11 @@ class LLMAgent(AlphaModel):
             parsed = self._parse(response)
         except Exception as exc:
             # Persist the raw response even when unparseable — the debug trail.
-            self._cache.put(key, {**record, "parse_error": str(exc)})
+            self._cache.put(key, record | {"parse_error": str(exc)})
             logger.warning("%s parse failed for %s@%s: %s", self.name, ticker, date, exc)
             return self._abstain(ticker, date, f"parse failed: {exc}")
 
-        self._cache.put(key, {**record, "parsed": parsed})
+        self._cache.put(key, record | {"parsed": parsed})
         return self._to_signal(ticker, date, parsed, key, snapshot, cached=False)
 
     # ------------------------------------------------------------------
@@ -11,7 +11,8 @@ backtest harness / portfolio construction decides timing and sizing.
 
 from __future__ import annotations
 
-from datetime import datetime
+from bisect import bisect_right
+from datetime import date
 
 from hedge_fund.data.protocol import DataClient
 from hedge_fund.data.models import EarningsRecord
@@ -39,9 +40,10 @@ class PEADModel(QuantModel):
     ) -> None:
         self._earnings_limit = earnings_limit
         self._signal_window_days = signal_window_days
-        # Cache earnings history per ticker — predict is called once per
-        # trading day during a backtest, so we fetch each ticker only once.
-        self._cache: dict[str, list[EarningsRecord]] = {}
+        # Cache qualifying events per ticker — predict is called once per
+        # trading day during a backtest, so each ticker's history is fetched
+        # and cleaned once, not re-deduped on every call.
+        self._cache: dict[str, list[dict]] = {}
 
     @property
     def name(self) -> str:
@@ -51,13 +53,14 @@ class PEADModel(QuantModel):
         as_of = _parse_date(date)
         events = self._qualifying_events(ticker, data_client)
 
-        # Point-in-time: only consider filings on or before `date` (no lookahead)
-        past = [e for e in events if _parse_date(e["filing_date"]) <= as_of]
-        if not past:
+        # Point-in-time: only consider filings on or before `date` (no
+        # lookahead). Events are sorted by filing date, so the most recent
+        # one as of `date` is a binary search away, not a scan per call.
+        n_past = bisect_right(events, date[:10], key=lambda e: e["filing_date"][:10])
+        if not n_past:
             return self._neutral(ticker, date)
 
-        # Most recent qualifying event as of `date`
-        event = max(past, key=lambda e: e["filing_date"])
+        event = events[n_past - 1]
         filed = _parse_date(event["filing_date"])
 
         # Only fire if the event is fresh (we just learned about it)
@@ -100,10 +103,8 @@ class PEADModel(QuantModel):
         comparison data from a current 8-K).
         """
         if ticker in self._cache:
-            records = self._cache[ticker]
-        else:
-            records = data_client.get_earnings_history(ticker, limit=self._earnings_limit)
-            self._cache[ticker] = records
+            return self._cache[ticker]
+        records = data_client.get_earnings_history(ticker, limit=self._earnings_limit)
 
         best: dict[str, tuple[int, EarningsRecord]] = {}
         for r in records:
@@ -123,16 +124,23 @@ class PEADModel(QuantModel):
             if r.report_period not in best or priority < best[r.report_period][0]:
                 best[r.report_period] = (priority, r)
 
-        return [
+        # Sorted by filing date for predict's bisect. Equal filing dates keep
+        # record order reversed, so a tie resolves to the first record — the
+        # same pick a max() over the list would make.
+        ordered = sorted(enumerate(best.values()),
+                         key=lambda ir: (ir[1][1].filing_date, -ir[0]))
+        events = [
             {
                 "filing_date": r.filing_date,
                 "report_period": r.report_period,
                 "source_type": r.source_type,
                 "surprise": r.quarterly.eps_surprise,
             }
-            for _, r in best.values()
+            for _, (_, r) in ordered
         ]
+        self._cache[ticker] = events
+        return events
 
 
-def _parse_date(s: str):
-    return datetime.strptime(s[:10], "%Y-%m-%d").date()
+def _parse_date(s: str) -> date:
+    return date.fromisoformat(s[:10])
@@ -84,6 +84,17 @@ class TestPEADPredict:
         sig = PEADModel().predict("TEST", "2025-07-15", fd)
         assert sig.value == 0.0
 
+    def test_latest_past_event_wins_over_one_model_lifetime(self):
+        # History arrives newest-first; one model instance walks the dates
+        fd = MockFDClient([
+            _rec("2025-09-30", "2025-11-01", "MISS"),
+            _rec("2025-06-30", "2025-08-01", "BEAT"),
+        ])
+        model = PEADModel()
+        assert model.predict("TEST", "2025-07-15", fd).value == 0.0  # nothing yet
+        assert model.predict("TEST", "2025-08-02", fd).value == 1.0
+        assert model.predict("TEST", "2025-11-03", fd).value == -1.0
+
     def test_freshness_window_bridges_weekend(self):
         # Filed Saturday 2025-08-02; queried Monday 2025-08-04 (2 days) → still fresh
         fd = MockFDClient([_rec("2025-06-30", "2025-08-02", "BEAT")])
@@ -20,17 +20,22 @@ with the non-interactive CLI (`hedge_fund/run.py`).
 
 from __future__ import annotations
 
-import json
 import os
+import threading
 import time
 from math import sqrt
 from statistics import mean, stdev
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import date as _date
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 import yaml
+from pydantic_core import from_json
 from rich import box
 from rich.console import Group
 from rich.table import Table
@@ -285,6 +290,22 @@ def _demand_run_keys(app, resume) -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
+def _picker_groups() -> tuple[tuple[str, tuple[tuple[str, str, str], ...]], ...]:
+    """The registry grouped by provider: registry order preserved, reachable
+    providers first — what you can actually pick should not sit below what
+    you cannot. The registry is fixed for the life of the process, so the
+    grouping is built on the first open of the picker, not on every one."""
+    groups: dict[str, list[tuple[str, str, str]]] = {}
+    for entry in load_api_models():
+        groups.setdefault(entry[2], []).append(entry)
+    return tuple(
+        (provider, tuple(models))
+        for provider, models in sorted(groups.items(),
+                                       key=lambda kv: not is_supported(kv[0]))
+    )
+
+
 class ModelPickerScreen(ModalScreen[str | None]):
     """Every model in the repo's registry, grouped by provider.
 
@@ -310,7 +331,7 @@ class ModelPickerScreen(ModalScreen[str | None]):
 
     def _options(self) -> list[Option | None]:
         options: list[Option | None] = []
-        for provider, models in self._by_provider().items():
+        for provider, models in _picker_groups():
             reachable = is_supported(provider)
             head = Text(provider.upper(), style=f"bold {BRIGHT}")
             if not reachable:
@@ -328,15 +349,6 @@ class ModelPickerScreen(ModalScreen[str | None]):
             options.append(None)
         return options[:-1] if options else options
 
-    def _by_provider(self) -> dict[str, list[tuple[str, str, str]]]:
-        """Registry order preserved, reachable providers first — what you can
-        actually pick should not sit below what you cannot."""
-        groups: dict[str, list[tuple[str, str, str]]] = {}
-        for entry in load_api_models():
-            groups.setdefault(entry[2], []).append(entry)
-        return dict(sorted(groups.items(),
-                           key=lambda kv: not is_supported(kv[0])))
-
     def on_mount(self) -> None:
         picker = self.query_one("#picker-list", OptionList)
         picker.highlighted = next(
@@ -363,10 +375,6 @@ class FundSelectScreen(Screen):
         Binding("d", "delete", "delete fund"),
     ]
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._summaries: dict[tuple[str, float], dict | None] = {}
-
     def compose(self) -> ComposeResult:
         with Horizontal(id="select"):
             with Vertical(id="select-rail"):
@@ -438,7 +446,6 @@ class FundSelectScreen(Screen):
             return
         path, spec = self._pending_delete
         gone = _delete_fund(path, spec.name, with_history=(scope == "all"))
-        self._summaries.clear()  # the cache is keyed on paths that just went
         self._populate()
         self.notify(f"Deleted {spec.name} — {gone} "
                     f"{'file' if gone == 1 else 'files'} removed")
@@ -450,16 +457,12 @@ class FundSelectScreen(Screen):
 
     def _history(self, name: str) -> list[dict]:
         """Everything this fund has done — runs and backtests — newest first,
-        as light summaries. Cached by (path, mtime) so arrowing the list stays
-        instant."""
+        as light summaries. _summarize is memoized on (path, mtime), so
+        arrowing the list stays instant."""
         out: list[dict] = []
         for pattern in (f"{name}-run-*.json", f"{name}-backtest*.json"):
             for p in FUNDS_DIR.glob(pattern):
-                mtime = p.stat().st_mtime
-                key = (str(p), mtime)
-                if key not in self._summaries:
-                    self._summaries[key] = _summarize(p, mtime)
-                summ = self._summaries[key]
+                summ = _summarize(p, p.stat().st_mtime)
                 if summ is not None:
                     out.append(summ)
         out.sort(key=lambda s: s["mtime"], reverse=True)
@@ -545,11 +548,17 @@ class ConfirmDeleteScreen(ModalScreen[str | None]):
         self.dismiss("all")
 
 
+@lru_cache(maxsize=512)
 def _summarize(path: Path, mtime: float) -> dict | None:
     """One saved receipt — a run's CycleRecord or a backtest's result — as the
-    light summary the history pane renders. None if the file is unreadable."""
+    light summary the history pane renders. None if the file is unreadable.
+
+    Memoized on (path, mtime): a backtest receipt carries every cycle and
+    runs to megabytes, and the fund list, history pane and ticker prefill all
+    ask for the same newest few. A rewritten file has a new mtime, so it is
+    never served stale."""
     try:
-        d = json.loads(path.read_text())
+        d = from_json(path.read_bytes())
         universe = d.get("universe", [])
         if "metrics" in d:  # a backtest
             m = d["metrics"]
@@ -568,7 +577,7 @@ def _summarize(path: Path, mtime: float) -> dict | None:
             "as_of": d["as_of"], "nav": d["nav"],
             "n_orders": len(d.get("orders", [])),
         }
-    except (json.JSONDecodeError, KeyError, OSError):
+    except (ValueError, KeyError, OSError):
         return None
 
 
@@ -583,7 +592,11 @@ def _last_universe(name: str) -> list[str] | None:
     """The tickers this fund was last pointed at — the ticker inputs prefill
     from it, so a returning user just presses enter."""
     for path in _receipts(name):
-        summary = _summarize(path, 0.0)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue  # deleted or rotated since _receipts listed it
+        summary = _summarize(path, mtime)
         if summary and summary["universe"]:
             return summary["universe"]
     return None
@@ -596,8 +609,9 @@ def _last_score(name: str) -> tuple[float, float, str] | None:
     files = list(FUNDS_DIR.glob(f"{name}-backtest*.json"))
     if not files:
         return None
-    newest = max(files, key=lambda p: p.stat().st_mtime)
-    summary = _summarize(newest, 0.0)
+    stamped = [(p.stat().st_mtime, p) for p in files]
+    mtime, newest = max(stamped, key=lambda mp: mp[0])
+    summary = _summarize(newest, mtime)
     if summary is None or summary["kind"] != "backtest":
         return None
     return (summary["total"], summary["excess"], summary["benchmark"])
@@ -1062,7 +1076,7 @@ def _tape_table(tape: list[tuple[str, Fill, int]]) -> Table:
         table.add_row(Text("no trades yet", style=MUTED))
         return table
 
-    for as_of, fill, shares in list(reversed(tape))[:_TAPE_ROWS]:
+    for as_of, fill, shares in islice(reversed(tape), _TAPE_ROWS):
         side = (Text("BUY ", style=f"bold {GREEN}") if fill.side == "buy"
                 else Text("SELL", style=f"bold {RED}"))
         book = (Text(f"→ long {shares}", style=GREEN) if shares > 0
@@ -1592,6 +1606,36 @@ class BuilderScreen(Screen):
         return Text.assemble((f"{name:<24}", "bold"), (tag, MUTED))
 
 
+@contextmanager
+def _thread_clients() -> Iterator[Callable[[], CachedDataClient]]:
+    """Hand each pool worker its own cached client, reused across its tasks.
+
+    requests sessions aren't shared-safe, so a client never crosses threads —
+    but opening one per *task* threw away its kept-alive connection (and paid
+    a fresh TLS handshake) dozens of times per warm. The CachedDataClient
+    wrapper lives as long as the FDClient under it, so a worker's in-memory
+    LRU carries from one chunk to the next. All are closed on exit.
+    """
+    local = threading.local()
+    opened: list[FDClient] = []
+    lock = threading.Lock()
+
+    def client() -> CachedDataClient:
+        fd = getattr(local, "fd", None)
+        if fd is None:
+            raw = FDClient()
+            with lock:
+                opened.append(raw)
+            fd = local.fd = CachedDataClient(raw)
+        return fd
+
+    try:
+        yield client
+    finally:
+        for raw in opened:
+            raw.close()
+
+
 class BacktestScreen(Screen):
     """Pick a fund → pick a window → warm → replay with a live equity curve.
 
@@ -1613,6 +1657,12 @@ class BacktestScreen(Screen):
         self._closes: dict[str, float] = {}
         self._dates: list[str] = []
         self._nav: list[float] = []
+        # Running tallies for the live board: peak, drawdown and the benchmark
+        # curve are extended one cycle at a time rather than rebuilt. The
+        # Sharpe and the chart still walk the whole curve on every tick.
+        self._benchmark_curve: list[float] = []
+        self._peak = 0.0
+        self._max_dd = 0.0
         self._n_cycles = 0
         self._tape: list[tuple[str, Fill, int]] = []  # (as_of, fill, shares after)
 
@@ -1790,9 +1840,9 @@ class BacktestScreen(Screen):
             fund = Fund(spec)
 
             def tick(i: int, n: int, record: CycleRecord) -> None:
-                started = time.time()
+                started = time.monotonic()
                 app.call_from_thread(self._board_tick, record)
-                dwell = _CYCLE_DWELL - (time.time() - started)
+                dwell = _CYCLE_DWELL - (time.monotonic() - started)
                 if dwell > 0:
                     time.sleep(dwell)
 
@@ -1822,25 +1872,27 @@ class BacktestScreen(Screen):
             for ticker in universe
             for j in range(0, len(grid), _WARM_CHUNK)
         ]
+        # run_cycle's mark window per date — the same for every ticker, so
+        # parse each date once here rather than once per (ticker, date).
+        lookbacks = {
+            as_of: (_date.fromisoformat(as_of)
+                    - timedelta(days=_MARK_LOOKBACK_DAYS)).isoformat()
+            for as_of in grid
+        }
         bar = self.query_one("#warm-progress", ProgressBar)
 
         def prefetch(ticker: str, dates: list[str]) -> None:
-            with FDClient() as raw:  # own client per task (requests isn't shared-safe)
-                fd = CachedDataClient(raw)
+            fd = client()  # this worker's own client
+            if has_agents:
+                fd.get_company_facts(ticker)
+            for as_of in dates:
+                fd.get_prices(ticker, lookbacks[as_of], as_of)
                 if has_agents:
-                    fd.get_company_facts(ticker)
-                for as_of in dates:
-                    lookback = (
-                        _date.fromisoformat(as_of)
-                        - timedelta(days=_MARK_LOOKBACK_DAYS)
-                    ).isoformat()
-                    fd.get_prices(ticker, lookback, as_of)
-                    if has_agents:
-                        fd.get_financial_metrics(ticker, as_of,
-                                                 period="ttm", limit=20)
-                    app.call_from_thread(bar.advance, 1)
-
-        with ThreadPoolExecutor(max_workers=8) as pool:
+                    fd.get_financial_metrics(ticker, as_of,
+                                             period="ttm", limit=20)
+                app.call_from_thread(bar.advance, 1)
+
+        with _thread_clients() as client, ThreadPoolExecutor(max_workers=8) as pool:
             futures = [pool.submit(prefetch, t, ds) for t, ds in chunks]
             for future in as_completed(futures):
                 future.result()  # fail loud — bad data poisons every cycle
@@ -1852,27 +1904,35 @@ class BacktestScreen(Screen):
         app = self.app
         display = {n: DISPLAY_NAMES.get(n, n) for n in _agent_names(spec)}
 
-        def warm(agent_name: str) -> None:
+        def warm(agent_name: str, ticker: str) -> None:
             who = display[agent_name]
-            model = ALPHA_MODEL_REGISTRY[agent_name]()  # own instance per thread
-            with FDClient() as raw:
-                fd = CachedDataClient(raw)
-                for as_of in grid:
-                    for ticker in universe:
-                        app.call_from_thread(
-                            self._roster_update, who, "working",
-                            f"{ticker} · {as_of}",
-                        )
-                        try:
-                            model.predict(ticker, as_of, fd)
-                        except Exception:
-                            pass  # best-effort warm; backtest_fund is the truth
-            app.call_from_thread(self._roster_update, who, "done", None)
-
+            model = ALPHA_MODEL_REGISTRY[agent_name]()  # own instance per task
+            fd = client()
+            for as_of in grid:
+                app.call_from_thread(
+                    self._roster_update, who, "working",
+                    f"{ticker} · {as_of}",
+                )
+                try:
+                    model.predict(ticker, as_of, fd)
+                except Exception:
+                    pass  # best-effort warm; backtest_fund is the truth
+
+        # One task per (agent, ticker), not per agent: the calls are network
+        # bound, and a two-agent fund would otherwise warm on two threads
+        # while the pool's other six sat idle. Ticker-major order keeps every
+        # agent's roster row moving from the start.
         names = list(display)
-        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
-            for future in as_completed([pool.submit(warm, n) for n in names]):
+        pending = {n: len(universe) for n in names}
+        with _thread_clients() as client, ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {pool.submit(warm, n, t): n for t in universe for n in names}
+            for future in as_completed(futures):
                 future.result()
+                name = futures[future]
+                pending[name] -= 1
+                if not pending[name]:
+                    app.call_from_thread(self._roster_update, display[name],
+                                         "done", None)
 
     # ---- UI-thread updates ------------------------------------------------
 
@@ -1913,6 +1973,9 @@ class BacktestScreen(Screen):
         self._closes = closes
         self._dates = []
         self._nav = []
+        self._benchmark_curve = [spec.capital]
+        self._peak = spec.capital
+        self._max_dd = 0.0
         self._n_cycles = n_cycles
         self._tape = []
         self.query_one("#phase-line", Static).update(Text.assemble(
@@ -1932,8 +1995,7 @@ class BacktestScreen(Screen):
         tape_box.remove_class("hidden")
 
     def _board_tick(self, record: CycleRecord) -> None:
-        """One cycle landed: update the stat tiles, redraw the curve.
-        Same math as run.py `_BacktestBoard._render`."""
+        """One cycle landed: update the stat tiles, redraw the curve."""
         assert self._spec is not None
         self._dates.append(record.as_of)
         self._nav.append(record.nav)
@@ -1945,32 +2007,28 @@ class BacktestScreen(Screen):
             self._closes[self._dates[-1]] / self._closes[self._dates[0]] - 1
         )
         curve = [capital] + self._nav
-        peak = curve[0]
-        max_dd = 0.0
-        for value in curve:
-            if value > peak:
-                peak = value
-            max_dd = max(max_dd, (peak - value) / peak)
+        self._peak = max(self._peak, nav)
+        self._max_dd = max(self._max_dd, (self._peak - nav) / self._peak)
 
         # Running Sharpe, same math as the engine's final _metrics: per-cycle
         # returns over the curve, sample stdev, annualized by cadence.
         returns = [b / a - 1 for a, b in zip(curve, curve[1:])]
-        if len(returns) > 1 and stdev(returns) > 0:
-            sharpe = (mean(returns) / stdev(returns)
+        sd = stdev(returns) if len(returns) > 1 else 0.0
+        if sd > 0:
+            sharpe = (mean(returns) / sd
                       * sqrt(_PERIODS_PER_YEAR[self._spec.rebalance]))
         else:
             sharpe = 0.0
         self._update_stats(nav, fund_return, benchmark_return,
-                           fund_return - benchmark_return, sharpe, max_dd)
+                           fund_return - benchmark_return, sharpe, self._max_dd)
 
-        benchmark_curve = [capital] + [
-            capital * self._closes[d] / self._closes[self._dates[0]]
-            for d in self._dates
-        ]
+        self._benchmark_curve.append(
+            capital * self._closes[self._dates[-1]] / self._closes[self._dates[0]]
+        )
         curve_widget = self.query_one("#curve", Static)
         width = curve_widget.content_size.width or 80
         curve_widget.update(Group(
-            *_render_area_chart(curve, benchmark_curve, capital, min(width, 100))
+            *_render_area_chart(curve, self._benchmark_curve, capital, min(width, 100))
         ))
         for fill in record.fills:
             self._tape.append(
@@ -113,74 +113,6 @@ def _money(value: float) -> str:
     return f"${value:,.0f}"
 
 
-def _render_chart(
-    fund: list[float],
-    benchmark: list[float],
-    baseline: float,
-    width: int,
-) -> list[Text]:
-    """Two-series unicode line chart, tearsheet-style: the fund against its
-    benchmark on one set of axes, dollar labels in a left gutter. Lines are
-    box-drawing polylines (asciichart-style), not filled areas — the gap
-    between the two lines is the point. The fund draws last, so where the
-    lines collide the fund wins the cell.
-    """
-    lo = min(min(fund), min(benchmark))
-    hi = max(max(fund), max(benchmark))
-    span = (hi - lo) or 1.0
-
-    labels = {
-        _CHART_HEIGHT - 1: _money(hi),
-        _CHART_HEIGHT // 2: _money(lo + span * (_CHART_HEIGHT // 2) / (_CHART_HEIGHT - 1)),
-        0: _money(lo),
-    }
-    gutter = max(len(label) for label in labels.values())
-    plot_width = max(20, width - gutter - 1)
-
-    def resample(values: list[float]) -> list[float]:
-        if len(values) == 1:
-            return values * plot_width
-        step = (len(values) - 1) / (plot_width - 1)
-        return [values[round(i * step)] for i in range(plot_width)]
-
-    # grid[row][col] = (char, style); row 0 is the top
-    grid = [[(" ", "") for _ in range(plot_width)] for _ in range(_CHART_HEIGHT)]
-
-    def draw(values: list[float], style_of) -> None:
-        cols = resample(values)
-        level = [round((v - lo) / span * (_CHART_HEIGHT - 1)) for v in cols]
-        for x in range(plot_width - 1):
-            y0, y1 = level[x], level[x + 1]
-            if y0 == y1:
-                grid[_CHART_HEIGHT - 1 - y0][x] = ("─", style_of(cols[x]))
-            else:
-                # Rising: turn up (╯) at the low level, arrive (╭) at the high.
-                # Falling: turn down (╮) at the high, arrive (╰) at the low.
-                grid[_CHART_HEIGHT - 1 - y0][x] = (
-                    "╯" if y1 > y0 else "╮", style_of(cols[x]))
-                grid[_CHART_HEIGHT - 1 - y1][x] = (
-                    "╭" if y1 > y0 else "╰", style_of(cols[x]))
-                for y in range(min(y0, y1) + 1, max(y0, y1)):
-                    grid[_CHART_HEIGHT - 1 - y][x] = ("│", style_of(cols[x]))
-        grid[_CHART_HEIGHT - 1 - level[-1]][-1] = ("─", style_of(cols[-1]))
-
-    draw(benchmark, lambda v: "cyan")
-    draw(fund, lambda v: "bold green" if v >= baseline else "bold red")
-
-    rows: list[Text] = []
-    for row in range(_CHART_HEIGHT):
-        level = _CHART_HEIGHT - 1 - row
-        line = Text()
-        if level in labels:
-            line.append(f"{labels[level]:>{gutter}}┤", style="dim")
-        else:
-            line.append(f"{'':>{gutter}}│", style="dim")
-        for char, style in grid[row]:
-            line.append(char, style=style)
-        rows.append(line)
-    return rows
-
-
 _BLOCKS = " ▁▂▃▄▅▆▇█"
 
 